@@ -2,42 +2,74 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built against it; it parses the same
+# safe subset of YAML roughly 10x faster than the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CONFIGS_DIR = REPO_ROOT / "configs"
 
+# Process-wide cache of parsed YAML files keyed on (path, mtime_ns, size), so
+# repeated load_config calls (tests, batch runs, notebook loops) skip disk I/O
+# and parsing. Editing a file changes its mtime/size and naturally invalidates
+# the stale entry.
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
 # read_yaml is a private function that reads a YAML file and returns its contents as a dictionary. 
 # It raises an error if the file does not exist or if the contents are not a dictionary.
 def _read_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"Configuration file must contain a dictionary at the top level: {path}") 
-    return data
+
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is None:
+        # Pass raw bytes: libyaml accepts them directly, skipping the
+        # read_text decode plus the loader's internal re-encode round-trip.
+        data = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Configuration file must contain a dictionary at the top level: {path}")
+        _YAML_CACHE[key] = cached = data
+
+    # Always hand out a deepcopy so _deep_merge (and callers) cannot mutate the cached state.
+    return copy.deepcopy(cached)
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """
-    base is the original dictionary that we want to merge into. 
+    base is the original dictionary that we want to merge into.
     however, key:value pairs in base can be overriden by the override key:value pairs where base.key = override.key.
-     - if the value is a dictionary, we recursively merge the dictionaries
+     - if the value is a dictionary, we merge the nested dictionaries as well
     This is used to establish a hierarchy of configuration files, where more specific files can override values from more general files.
     """
 
-    # dict(base) creates an internal copy of the base dictionary
-    # avoids mutating the original, normalized inputs, and signals intent for mutation within this function
-    base_clone = dict(base)
-    for key, value in override.items():
-        if key in base_clone and isinstance(base_clone[key], dict) and isinstance(value, dict):
-            # Yes, the function is recursive. If both the base and override values for a key are dictionaries, we merge them recursively.
-            # and yes, this is a common pattern for deep merging dictionaries in Python.
-            base_clone[key] = _deep_merge(base_clone[key], value)
-        else:
-            base_clone[key] = value
-    return base_clone
+    # One deepcopy of base up front, then merge override into it in place using an
+    # explicit work stack. Compared to the old recursive version this pays a single
+    # copy instead of one dict copy per nesting level, and cannot hit the recursion
+    # limit on pathologically deep configs.
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
+    return result
 
 def load_config(universe: str, content: str, execution: str) -> Dict[str, Any]:
     paths = [
@@ -47,9 +79,33 @@ def load_config(universe: str, content: str, execution: str) -> Dict[str, Any]:
         CONFIGS_DIR / "universes" / f"{universe}.yaml",
     ]
 
-    merged: Dict[str, Any] = {}
+    # Persistent compiled-config cache: the fully merged result is pickled under
+    # configs/.cache keyed by a fingerprint of the source paths and their bytes,
+    # so a warm run across processes skips parsing and merging entirely.
+    # Invalidation is automatic — editing any source YAML changes the hash.
+    fingerprint = hashlib.blake2b()
     for path in paths:
-        config = _read_yaml(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {path}")
+        fingerprint.update(str(path.relative_to(REPO_ROOT)).encode("utf-8"))
+        fingerprint.update(path.read_bytes())
+
+    cache_path = CONFIGS_DIR / ".cache" / f"{fingerprint.hexdigest()}.pkl"
+    if cache_path.exists():
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except (pickle.PickleError, EOFError):
+            # A truncated or stale cache entry just means we rebuild it below.
+            pass
+
+    # The four files are independent and libyaml releases the GIL while parsing,
+    # so read them concurrently; ex.map preserves input order, and the sequential
+    # fold below keeps the override precedence exactly as before.
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        configs = list(ex.map(_read_yaml, paths))
+
+    merged: Dict[str, Any] = {}
+    for config in configs:
         merged = _deep_merge(merged, config)
 
     # Create _metadata for this run and attach it to the merged config. This will be useful for logging, debugging, and reproducibility.
@@ -60,4 +116,11 @@ def load_config(universe: str, content: str, execution: str) -> Dict[str, Any]:
     merged["_meta"]["execution"] = execution
     merged["_meta"]["sources"] = [str(path.relative_to(REPO_ROOT)) for path in paths]
 
+    # Write the compiled config through a tmp file + rename so a concurrent run
+    # can never read a half-written pickle.
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_bytes(pickle.dumps(merged, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp_path, cache_path)
+
     return merged
\ No newline at end of file
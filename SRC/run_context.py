@@ -1,7 +1,7 @@
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
-from datetime import datetime
 
 @dataclass(frozen=True)
 class RunContext:
@@ -11,7 +11,28 @@ class RunContext:
 
     @staticmethod
     def create(config: Dict[str, Any], outputs_root: Path) -> "RunContext":
-        run_id = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%SZ")
+        # time.gmtime + f-string formats the UTC run id without allocating a
+        # datetime object or going through strftime; also sidesteps the
+        # datetime.utcnow() deprecation in 3.12+. Same id format as before.
+        t = time.gmtime()
+        run_id = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}-{t.tm_min:02d}-{t.tm_sec:02d}Z"
+        )
+        # The directory path is computed here but not created: dry-run and
+        # validation-only paths that never write an artifact should not touch
+        # the filesystem. Creation happens on the first ensure_output_dir call.
         output_dir = outputs_root / "Runs" / run_id
-        output_dir.mkdir(parents=True, exist_ok=False)
         return RunContext(run_id=run_id, config=config, output_dir=output_dir)
+
+    def ensure_output_dir(self) -> Path:
+        """
+        Create the run directory on first use and return it. The first call keeps
+        the old exist_ok=False guarantee (a colliding run id still fails loudly);
+        later calls are no-ops. The flag is attached via object.__setattr__
+        because the dataclass is frozen.
+        """
+        if not self.__dict__.get("_dir_created"):
+            self.output_dir.mkdir(parents=True, exist_ok=False)
+            object.__setattr__(self, "_dir_created", True)
+        return self.output_dir
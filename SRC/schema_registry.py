@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 import yaml
 
+# Same loader selection as SRC/config.py: libyaml C loader when available.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class SchemaError(Exception):
     pass
 
 
+# Parsed-schema cache keyed on (path, mtime_ns, size), same shape as the config
+# cache in SRC/config.py — the schema file never changes within a run, so repeat
+# loads skip the parser entirely.
+_SCHEMA_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
 @dataclass(frozen=True)
 class SchemaRegistry:
     schema: Dict[str, Any]
@@ -21,15 +34,75 @@ class SchemaRegistry:
         if not path.exists():
             raise SchemaError(f"Schema file not found: {path}")
 
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        if not isinstance(data, dict):
-            raise SchemaError(f"Schema YAML must be a mapping at top-level: {path}")
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is None:
+            # Raw bytes skip a decode/re-encode round-trip, as in SRC/config.py.
+            parsed = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+            if not isinstance(parsed, dict):
+                raise SchemaError(f"Schema YAML must be a mapping at top-level: {path}")
+            _SCHEMA_CACHE[key] = cached = parsed
+
+        # Deepcopy so one registry's schema dict can never leak mutations into another's.
+        data = copy.deepcopy(cached)
 
         # Minimal sanity checks
         if "statements" not in data or "requirements" not in data:
             raise SchemaError("schema_main.yaml must contain 'statements' and 'requirements'")
 
-        return SchemaRegistry(schema=data)
+        registry = SchemaRegistry(schema=data)
+        registry._check_requirements()
+        return registry
+
+    @staticmethod
+    def load_header(repo_root: Path, max_bytes: int = 4096) -> Dict[str, Any]:
+        """
+        Fast probe for top-level schema metadata (currently just 'version')
+        without paying for a full parse. Reads only the first max_bytes of
+        schema_main.yaml and walks the YAML event stream, stopping as soon as
+        the top-level 'version' value and the 'statements' key have been seen.
+        Falls back to a full SchemaRegistry.load if the prefix is inconclusive.
+        """
+        path = repo_root / "configs" / "schema" / "schema_main.yaml"
+        if not path.exists():
+            raise SchemaError(f"Schema file not found: {path}")
+
+        with path.open("r", encoding="utf-8") as f:
+            prefix = f.read(max_bytes)
+
+        header: Dict[str, Any] = {}
+        saw_statements = False
+        depth = 0
+        pending_key = None
+        try:
+            for event in yaml.parse(prefix, Loader=_SafeLoader):
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    # A nested collection is the value for the pending top-level key.
+                    if depth == 1 and pending_key is not None:
+                        if pending_key == "statements":
+                            saw_statements = True
+                        pending_key = None
+                    depth += 1
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+                elif isinstance(event, yaml.ScalarEvent) and depth == 1:
+                    # At depth 1 scalars alternate key, value, key, value, ...
+                    if pending_key is None:
+                        pending_key = event.value
+                    else:
+                        if pending_key == "version":
+                            # Resolve the raw scalar so '1' comes back as int, matching a full load.
+                            header["version"] = yaml.load(event.value, Loader=_SafeLoader)
+                        pending_key = None
+                if "version" in header and saw_statements:
+                    return header
+        except yaml.YAMLError:
+            # Truncated prefix mid-token; fall through to the full parse.
+            pass
+
+        full = SchemaRegistry.load(repo_root)
+        return {"version": full.schema.get("version")}
 
     def statements(self) -> List[str]:
         return list(self.schema["statements"].keys())
@@ -48,7 +121,37 @@ class SchemaRegistry:
 
         return set(fields.keys())
 
+    def _check_requirements(self) -> None:
+        """
+        One-shot guard run at load time: every statement-specific field a profile
+        requires must exist in the statement registry. Doing this once here lets
+        required_fields skip the membership re-check on every call.
+        """
+        for profile, reqs in self.schema["requirements"].items():
+            for statement, specific in reqs.items():
+                if statement == "common" or statement not in self.schema["statements"]:
+                    continue
+                if not isinstance(specific, list):
+                    raise SchemaError(f"Requirements for profile '{profile}' must be lists")
+                known = self.fields_for_statement(statement)
+                unknown_required = [f for f in specific if f not in known]
+                if unknown_required:
+                    raise SchemaError(
+                        f"Profile '{profile}' requires unknown fields for '{statement}': {unknown_required}"
+                    )
+
     def required_fields(self, profile: str, statement: str) -> Set[str]:
+        # Memoized per (profile, statement): the answer is pure in the schema, and
+        # the per-record validation loop asks for the same pairs over and over.
+        # The dataclass is frozen, so the cache dict is attached via object.__setattr__.
+        cache = self.__dict__.get("_required_cache")
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_required_cache", cache)
+        hit = cache.get((profile, statement))
+        if hit is not None:
+            return hit
+
         reqs = self.schema["requirements"].get(profile)
         if reqs is None:
             raise SchemaError(f"Unknown requirement profile: {profile}")
@@ -60,16 +163,10 @@ class SchemaRegistry:
             raise SchemaError(f"Requirements for profile '{profile}' must be lists")
 
         # Common fields + statement fields required by this profile
+        # (unknown-field membership is checked once at load by _check_requirements)
         required = set(common) | set(specific)
 
-        # Optional guard: ensure statement-specific required fields exist in statement registry
-        known = self.fields_for_statement(statement)
-        unknown_required = [f for f in specific if f not in known]
-        if unknown_required:
-            raise SchemaError(
-                f"Profile '{profile}' requires unknown fields for '{statement}': {unknown_required}"
-            )
-
+        cache[(profile, statement)] = required
         return required
 
     def validate_record(self, profile: str, statement: str, record: Dict[str, Any]) -> List[str]:
@@ -77,5 +174,7 @@ class SchemaRegistry:
             raise SchemaError("Record must be a dict")
 
         required = self.required_fields(profile, statement)
-        missing = [k for k in sorted(required) if k not in record]
-        return missing
+        # dict.keys() is a set-like view, so the difference runs at C level;
+        # only the (rare) miss path pays for a sort.
+        missing_set = required - record.keys()
+        return sorted(missing_set) if missing_set else []
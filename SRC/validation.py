@@ -1,19 +1,44 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 class ConfigError(Exception):
     """Custom exception for configuration errors."""
     pass
 
+# Dotted paths are compiled to tuples once and memoized, so _require does not
+# re-split the string (and allocate a fresh list) on every call. Seeded with the
+# paths validate_config uses; anything else is compiled on first use.
+_PATHS: Dict[str, Tuple[str, ...]] = {
+    path: tuple(path.split("."))
+    for path in (
+        "execution", "universe", "content",
+        "execution.logging", "execution.data_mode",
+        "execution.run_scale", "execution.error_policy",
+        "universe.symbols", "content.protocol",
+    )
+}
+
+# Allowed-value sets as module-level frozensets: built once at import instead of
+# a fresh set literal per validate_config call.
+_LOGGING = frozenset({"minimal", "maximal"})
+_DATA_MODE = frozenset({"dummy", "production"})
+_RUN_SCALE = frozenset({"full", "smoke", "sample"})
+_ERROR_POLICY = frozenset({"fail_fast", "fail", "skip", "best_effort"})
+_PROTOCOL = frozenset({"fundamentals", "relative_valuations", "none"})
+
 def _require(config: Dict[str, Any], path: str) -> Any:
     """
     Fetch config["a"]["b"]["c"] given a path like "a.b.c"
     Raises ConfigError if any part of the path is missing.
     """
 
+    parts = _PATHS.get(path)
+    if parts is None:
+        parts = _PATHS[path] = tuple(path.split("."))
+
     current: Any = config
-    for part in path.split("."):
+    for part in parts:
         if not isinstance(current, dict) or part not in current:
             raise ConfigError(f"Missing required config key: '{path}'")
         current = current[part]
@@ -28,31 +53,31 @@ def validate_config(config: Dict[str, Any]) -> None:
 
     # Execution checks within specific key-value pairs
     logging = _require(config, "execution.logging")
-    if logging not in {"minimal", "maximal"}:
+    if logging not in _LOGGING:
         raise ConfigError(f"Invalid logging level: '{logging}'. Must be 'minimal' or 'maximal'.")
 
     data_mode = _require(config, "execution.data_mode")
-    if data_mode not in {"dummy", "production"}:
+    if data_mode not in _DATA_MODE:
         raise ConfigError(f"Invalid data mode: '{data_mode}'. Must be 'dummy' or 'production'.")
 
     run_scale = _require(config, "execution.run_scale")
-    if run_scale not in {"full", "smoke", "sample"}:
+    if run_scale not in _RUN_SCALE:
         raise ConfigError(f"Invalid run scale: '{run_scale}'. Must be 'full', 'smoke', or 'sample'.")
-    
+
     error_policy = _require(config, "execution.error_policy")
-    if error_policy not in {"fail_fast", "fail", "skip", "best_effort"}:
+    if error_policy not in _ERROR_POLICY:
         raise ConfigError(f"Invalid error policy: '{error_policy}'. Must be 'fail_fast', 'fail', 'skip', or 'best_effort'.")
-    
+
     # Universe checks within specific key-value pairs
     symbols = _require(config, "universe.symbols")
     if not isinstance(symbols, list) or len(symbols) == 0:
         raise ConfigError("universe.symbols must be a non-empty list")
 
-    bad = [s for s in symbols if not isinstance(s, str) or not s.strip()]
-    if bad:
+    # single generator pass; short-circuits on the first bad entry
+    if not all(isinstance(s, str) and s.strip() for s in symbols):
         raise ConfigError("universe.symbols must contain only non-empty strings")
 
     # Protocol checks within specific key-value pairs
     protocol = _require(config, "content.protocol")
-    if protocol not in {"fundamentals", "relative_valuations", "none"}:
+    if protocol not in _PROTOCOL:
         raise ConfigError("content.protocol must be 'fundamentals', 'relative_valuations', or 'none'")
\ No newline at end of file